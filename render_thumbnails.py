@@ -1,8 +1,14 @@
 import bpy
+import numpy as np
 from typing import List
 from bpy.types import AddonPreferences
-from bpy.props import IntProperty, BoolProperty
+from bpy.props import IntProperty, BoolProperty, EnumProperty
+from mathutils import Vector
 import os
+import shutil
+import string
+import subprocess
+import tempfile
 
 bl_info = {
     "name": "Render Asset Thumbnails",
@@ -15,109 +21,261 @@ bl_info = {
 }
 
 
+# Relative change in bounds size/position under which the previous camera framing is kept
+CAMERA_REUSE_TOLERANCE = 0.15
+
+
+# Collection names are used in directory names without any whitespace
+STRIP_WHITESPACE = str.maketrans('', '', string.whitespace)
+
+
+# Executed by each background worker. Arguments after '--' are (id_type, name, filepath) triples,
+# the .blend copy it opens already has the camera and render settings prepared by the main instance
+WORKER_SCRIPT = '''
+import bpy, sys
+argv = sys.argv[sys.argv.index("--") + 1:]
+scene = bpy.context.scene
+for id_type, name, filepath in zip(argv[0::3], argv[1::3], argv[2::3]):
+    for obj in bpy.context.view_layer.objects:
+        obj.select_set(False)
+    if id_type == "OBJECT":
+        asset = bpy.data.objects[name]
+        asset.hide_render = False
+        asset.select_set(True)
+        bpy.context.view_layer.objects.active = asset
+    else:
+        asset = bpy.data.collections[name]
+        asset.hide_render = False
+        for child in asset.children_recursive:
+            child.hide_render = False
+        for obj in asset.all_objects:
+            obj.hide_render = False
+            obj.select_set(True)
+    bpy.ops.view3d.camera_to_view_selected()
+    scene.render.filepath = filepath
+    bpy.ops.render.render(write_still=True)
+    asset.hide_render = True
+'''
+
+
 class RenderAssetThumbnails(bpy.types.Operator):
     bl_idname = "asset.render_thumbnails"
     bl_label = "Render Thumbnail(s)"
 
     thumb_dir = ''
-    visible_objects = []
+    _hidden_snapshot = {}  # session_uid to hide_render of every object before executing
     _settings = {}  # This is to revert render settings after executing
+    _collection_dirs = {}  # Collection name to its thumbnail directory, created during this batch
+    _prefs = None  # Addon preferences, looked up once per execution
+    _handlers = {}
+    _collection_names = {}
     allowed_types = ["COLLECTION", "OBJECT"]
 
+    # State of a parallel batch, see launch_workers()
+    _batch_running = False  # Set on the class, so every instance sees it
+    _timer = None
+    _workers = []
+    _executed_objects = {}
+    _asset_count = 0
+    _finished_jobs = 0  # Rendered or failed jobs, skipped asset types are not counted by the progress
+    _tmp_dir = ''
+    _output_mtimes = {}  # Asset name to the modification time of its thumbnail before the batch
+
 
 
     @classmethod
     def poll(cls, context):
-        return context.selected_assets
+        # A second run would snapshot the scene settings of the batch still running
+        return context.selected_assets and not cls._batch_running
+
+
+
+    def read_object_states(self) -> tuple:
+        # Read hide_render in bulk, per object RNA access adds up in large scenes
+        objs = bpy.data.objects
+        uids = np.empty(len(objs), dtype=np.intc)
+        hidden = np.empty(len(objs), dtype=bool)
+        objs.foreach_get("session_uid", uids)
+        objs.foreach_get("hide_render", hidden)
+        return uids, hidden
 
 
 
     def disable_visible_objects(self) -> None:
-        self.visible_objects = [obj for obj in bpy.data.objects if obj.hide_render == False]
-        for obj in self.visible_objects:
-            obj.hide_render = True
+        uids, hidden = self.read_object_states()
+        # Keyed by session_uid, objects can be renamed, added or removed while background workers are rendering
+        self._hidden_snapshot = dict(zip(uids.tolist(), hidden.tolist()))
+        bpy.data.objects.foreach_set("hide_render", np.ones_like(hidden))
 
 
 
     def enable_visible_objects(self) -> None:
-        for obj in self.visible_objects:
-            obj.hide_render = False
+        uids, hidden = self.read_object_states()
+        # Objects created during the batch keep their current state
+        snapshot = self._hidden_snapshot
+        restored = np.fromiter((snapshot.get(uid, hide) for uid, hide in zip(uids.tolist(), hidden.tolist())),
+                               dtype=bool, count=len(uids))
+        bpy.data.objects.foreach_set("hide_render", restored)
 
 
 
     def enable_and_select(self, asset):
-        if isinstance(asset, bpy.types.Object):
-            asset.hide_render = False
-            asset.select_set(True)
-            bpy.context.view_layer.objects.active = asset
-            return asset
-        if isinstance(asset, bpy.types.Collection):
-            collection = bpy.data.collections.get(asset.name)
-            if collection:
-                # Iterate through the objects in the collection and select them
-                self.select_all_objects_in_collection(collection)
-                return collection
+        return self._handlers[type(asset)](asset)
+
+
+
+    def _enable_obj(self, obj: bpy.types.Object) -> bpy.types.Object:
+        obj.hide_render = False
+        obj.select_set(True)
+        bpy.context.view_layer.objects.active = obj
+        return obj
+
+
+
+    def _enable_coll(self, collection: bpy.types.Collection) -> bpy.types.Collection:
+        # Iterate through the objects in the collection and select them
+        self.select_all_objects_in_collection(collection)
+        return collection
 
     # 4.0+ Overridden context for loading assets
-    def update_thumbnail(self, context, asset: bpy.types.FileSelectEntry, location: str) -> None:
+    def update_thumbnail(self, context, local_id: bpy.types.ID, location: str, name: str = None) -> None:
+        # name is what the thumbnail was written as, it differs from local_id.name if the asset was renamed since
+        filepath = f"{location}/{name or local_id.name}{context.scene.render.file_extension}"
         if bpy.app.version >= (4, 0, 0):
-            with context.temp_override(id=asset.local_id):
+            with context.temp_override(id=local_id):
                 bpy.ops.ed.lib_id_load_custom_preview(
-                    filepath=f"{location}/{asset.local_id.name}.png"
+                    filepath=filepath
                 )
         else:
             bpy.ops.ed.lib_id_load_custom_preview(
-                {"id": asset.local_id},
-                filepath=f"{location}/{asset.local_id.name}.png")
+                {"id": local_id},
+                filepath=filepath)
+
+
+
+    def deselect_all(self, context) -> None:
+        # Cheaper than the select_all operator, only touches objects that are actually selected
+        # select_set can rebuild the view layer's bases, so don't iterate the live collection
+        for obj in list(context.view_layer.objects.selected):
+            obj.select_set(False)
 
 
 
     def get_area_type(self, _type: str) -> bpy.types.Area or None:
         if not _type:
             return None
-        return [area for area in bpy.context.window.screen.areas if area.type == _type][0]
+        return next((area for area in bpy.context.window.screen.areas if area.type == _type), None)
 
 
 
     def get_collection_name(self, asset):
-        if type(asset) == bpy.types.Object:
-            return asset.users_collection[0].name
-        if type(asset) == bpy.types.Collection:
-            return asset.name
+        return self._collection_names[type(asset)](asset)
 
 
 
     def select_all_objects_in_collection(self, collection: bpy.types.Collection) -> None:
         """
-        Recursively select all objects in the given collection and its sub-collections.
+        Select all objects in the given collection and its sub-collections.
 
         Args:
             collection: The Blender collection to start the selection from.
         """
         if not collection:
             return
-        collection.hide_render = False
-        for obj in collection.objects:
-            obj.select_set(True)
-            obj.hide_render = False
+        stack = [collection]
+        while stack:
+            coll = stack.pop()
+            coll.hide_render = False
+            objs = coll.objects
+            if objs:
+                objs.foreach_set("hide_render", np.zeros(len(objs), dtype=bool))
+                for obj in objs:
+                    obj.select_set(True)
+            stack.extend(coll.children)
+
+
+
+    def get_bounds(self, asset) -> tuple:
+        """
+        World space bounding box of an object or of every object in a collection.
+
+        Returns:
+            Center and diagonal length of the bounding box.
+        """
+        objs = asset.all_objects if isinstance(asset, bpy.types.Collection) else [asset]
+        corners = [obj.matrix_world @ Vector(corner) for obj in objs for corner in obj.bound_box]
+        if not corners:
+            return Vector(), 0.0
+        low = Vector(map(min, zip(*corners)))
+        high = Vector(map(max, zip(*corners)))
+        return (low + high) / 2, (high - low).length
 
-        for sub_collection in collection.children:
-            self.select_all_objects_in_collection(sub_collection)
+
+
+    def is_framed(self, bounds: tuple, framed_bounds: tuple or None) -> bool:
+        # The camera was last framed around framed_bounds, keep it if bounds is about the same box
+        if framed_bounds is None or not framed_bounds[1]:
+            return False
+        center, diag = bounds
+        framed_center, framed_diag = framed_bounds
+        return (abs(diag - framed_diag) / framed_diag < CAMERA_REUSE_TOLERANCE
+                and (center - framed_center).length / framed_diag < CAMERA_REUSE_TOLERANCE)
+
+
+
+    def frame_camera(self, asset, framed_bounds: tuple or None) -> tuple or None:
+        """
+        Frame the scene camera on the selected asset, unless it is already framed on similar bounds.
+
+        Args:
+            asset: Object or collection that is selected.
+            framed_bounds: Bounds the camera was last framed on, if any.
+
+        Returns:
+            Bounds the camera is now framed on.
+        """
+        if not self._prefs.reuse_camera_framing:
+            bpy.ops.view3d.camera_to_view_selected()
+            return None
+        bounds = self.get_bounds(asset)
+        if self.is_framed(bounds, framed_bounds):
+            return framed_bounds
+        bpy.ops.view3d.camera_to_view_selected()
+        return bounds
+
+
+
+    def get_collection_dir(self, filename: str, asset) -> str:
+        # Get collection to which object belongs to
+        collection_name = self.get_collection_name(asset)
+        collection_dir = self._collection_dirs.get(collection_name)
+        if collection_dir is None:
+            collection_dir = os.path.join(self.thumb_dir, f"{filename}_{collection_name.translate(STRIP_WHITESPACE)}")
+            os.makedirs(collection_dir, exist_ok=True)
+            self._collection_dirs[collection_name] = collection_dir
+        return collection_dir
 
 
 
     def render_thumbnail(self, context, assets: List[bpy.types.FileSelectEntry]) -> List:
         executed_objects = {}
+        pending_previews = []  # Previews are loaded once every asset is rendered
 
-        bpy.context.window_manager.progress_begin(0, len(assets))
-        bpy.context.scene.frame_start = 1
-        bpy.context.scene.frame_end = 1
-        bpy.context.scene.frame_set(1)
-        filename = bpy.path.basename(bpy.context.blend_data.filepath).replace(".blend", "")
+        # Bind what the loop uses to locals instead of walking attribute chains per asset
+        render = context.scene.render
+        wm = context.window_manager
+
+        wm.progress_begin(0, len(assets))
+        progress_step = max(1, len(assets) // 50)  # Enough updates for the progress cursor to move
+        filename = bpy.path.basename(context.blend_data.filepath).replace(".blend", "")
+
+        # The render needs a 3D viewport context, it is the same for every asset
+        area = self.get_area_type('VIEW_3D')
+        override = {'area': area, 'region': area.regions[-1]}
+        prev_bounds = None
 
         for idx, asset in enumerate(assets):
-            bpy.context.scene.frame_set(idx)
-            bpy.ops.object.select_all(action='DESELECT')
+            self.deselect_all(context)
 
             # This operation supports only mesh objects and collections
             if asset.id_type in self.allowed_types:
@@ -126,35 +284,177 @@ class RenderAssetThumbnails(bpy.types.Operator):
                     executed_objects[active_obj.name] = 'ERROR'
                     return
 
-                # Get collection to which object belongs to
-                collection_dir = f"{self.thumb_dir}/{filename}_{''.join(self.get_collection_name(active_obj).split())}"
-                os.makedirs(collection_dir, exist_ok=True)
-
-                bpy.ops.view3d.camera_to_view_selected()
-                bpy.context.scene.render.filepath = os.path.join(collection_dir, active_obj.name)
-                bpy.context.scene.render.image_settings.file_format = 'PNG'
-                area = self.get_area_type('VIEW_3D')
-                override_context = bpy.context.copy()
-                override_context['area'] = area
-                override_context['region'] = area.regions[-1]
-                with bpy.context.temp_override(**override_context):
+                collection_dir = self.get_collection_dir(filename, active_obj)
+
+                prev_bounds = self.frame_camera(active_obj, prev_bounds)
+                render.filepath = os.path.join(collection_dir, active_obj.name)
+                with context.temp_override(**override):
                     bpy.ops.render.render(write_still=True)
-                self.update_thumbnail(context, assets[idx], collection_dir)
+                pending_previews.append((asset.local_id, collection_dir))
                 executed_objects[active_obj.name] = 'INFO'
                 active_obj.hide_render = True
-                bpy.context.window_manager.progress_update(idx)
+                if idx % progress_step == 0:
+                    wm.progress_update(idx)
             else:
                 executed_objects[asset.local_id.name] = 'ERROR'
-        bpy.context.window_manager.progress_end()
+        wm.progress_end()
+
+        for local_id, collection_dir in pending_previews:
+            self.update_thumbnail(context, local_id, collection_dir)
         return executed_objects
 
 
 
+    def launch_workers(self, context, assets: List[bpy.types.FileSelectEntry], num_procs: int) -> None:
+        """
+        Render the assets in background Blender instances, each one handling a shard of the batch.
+
+        Args:
+            assets: Assets selected in the asset browser.
+            num_procs: Maximum amount of background instances to spawn.
+        """
+        self._executed_objects = {}
+        self._asset_count = len(assets)
+        filename = bpy.path.basename(bpy.context.blend_data.filepath).replace(".blend", "")
+
+        # Jobs only keep plain values, the IDs can be renamed or invalidated by an undo during the batch
+        jobs = []
+        for asset in assets:
+            if asset.id_type in self.allowed_types:
+                local_id = asset.local_id
+                jobs.append((asset.id_type, local_id.session_uid, local_id.name,
+                             self.get_collection_dir(filename, local_id)))
+            else:
+                self._executed_objects[asset.local_id.name] = 'ERROR'
+
+        # Workers open a copy of the file with the camera and visibility already set up
+        self._tmp_dir = tempfile.mkdtemp(prefix="thumbnails_")
+        tmp_blend = os.path.join(self._tmp_dir, f"{filename}.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=tmp_blend, copy=True)
+
+        # Success is decided per asset by its output file being (re)written, remember what is there now
+        self._output_mtimes = {name: self.get_output_mtime(context, name, collection_dir)
+                               for _, _, name, collection_dir in jobs}
+
+        self._workers = []
+        self._finished_jobs = 0
+        num_procs = min(num_procs, len(jobs))
+        for idx, shard in enumerate(jobs[i::num_procs] for i in range(num_procs)):
+            argv = []
+            for id_type, _, name, collection_dir in shard:
+                argv += [id_type, name, os.path.join(collection_dir, name)]
+            log_path = os.path.join(self._tmp_dir, f"worker_{idx}.log")
+            with open(log_path, "w") as log:
+                proc = subprocess.Popen(
+                    [bpy.app.binary_path, "-b", tmp_blend, "--python-exit-code", "1",
+                     "--python-expr", WORKER_SCRIPT, "--", *argv],
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                )
+            self._workers.append((proc, shard, log_path))
+
+        RenderAssetThumbnails._batch_running = True
+        wm = context.window_manager
+        wm.progress_begin(0, len(jobs))
+        self._timer = wm.event_timer_add(0.5, window=context.window)
+        wm.modal_handler_add(self)
+
+
+
+    def get_output_mtime(self, context, name: str, collection_dir: str) -> int or None:
+        try:
+            return os.stat(os.path.join(collection_dir, f"{name}{context.scene.render.file_extension}")).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+
+
+    def find_id(self, id_type: str, session_uid: int) -> bpy.types.ID or None:
+        data = bpy.data.objects if id_type == 'OBJECT' else bpy.data.collections
+        return next((local_id for local_id in data if local_id.session_uid == session_uid), None)
+
+
+
+    def poll_workers(self, context) -> bool:
+        running = []
+        for worker in self._workers:
+            proc, shard, log_path = worker
+            if proc.poll() is None:
+                running.append(worker)
+                continue
+            for id_type, session_uid, name, collection_dir in shard:
+                mtime = self.get_output_mtime(context, name, collection_dir)
+                if mtime is None or mtime == self._output_mtimes[name]:
+                    self._executed_objects[name] = 'ERROR'
+                    continue
+                # The asset may have been deleted, or removed by an undo, while it was rendering
+                local_id = self.find_id(id_type, session_uid)
+                if local_id:
+                    self.update_thumbnail(context, local_id, collection_dir, name)
+                self._executed_objects[name] = 'INFO'
+            self._finished_jobs += len(shard)
+            if proc.returncode != 0:
+                self.report_worker_failure(proc.returncode, log_path)
+        self._workers = running
+        return not self._workers
+
+
+
+    def report_worker_failure(self, returncode: int, log_path: str) -> None:
+        # The temp directory is removed after the batch, so report the end of the log instead of its path
+        with open(log_path, errors="replace") as log:
+            tail = log.readlines()[-20:]
+        self.report({'WARNING'}, f"Background worker exited with code {returncode}:\n{''.join(tail).rstrip()}")
+
+
+
+    def modal(self, context, event):
+        done = True  # Stays set if anything below raises, so the scene is always restored
+        try:
+            if event.type == 'ESC':
+                return {'CANCELLED'}
+
+            if event.type != 'TIMER':
+                done = False
+                return {'PASS_THROUGH'}
+
+            done = self.poll_workers(context)
+            context.window_manager.progress_update(self._finished_jobs)
+            return {'FINISHED'} if done else {'PASS_THROUGH'}
+        finally:
+            if done:
+                self.finish(context)
+
+
+
+    def finish(self, context) -> None:
+        RenderAssetThumbnails._batch_running = False
+        # Workers are still running when the batch is cancelled or modal() failed
+        for proc, _, _ in self._workers:
+            proc.terminate()
+            proc.wait()
+        self._workers = []
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+        # Only show the report if the user has more than one asset selected
+        if self._prefs.show_report and self._executed_objects and self._asset_count > 1:
+            self.show_report(self._executed_objects)
+
+        self.enable_visible_objects()
+        self.restore_render_settings(context)
+
+
+
     def show_report(self, executed_objects):
-        if bpy.context.preferences.addons[__name__].preferences.show_report:
-            for obj in executed_objects:
-                self.report({executed_objects[obj]},
-                            f"{'Updated' if executed_objects[obj] == 'INFO' else 'Skipped'} thumbnail for asset '{obj}'")
+        if self._prefs.show_report:
+            # One multi-line report per severity, each report call posts to the info log on its own
+            for level, verb in (('INFO', 'Updated'), ('ERROR', 'Skipped')):
+                lines = [f"{verb} thumbnail for asset '{obj}'" for obj, status in executed_objects.items() if status == level]
+                if lines:
+                    self.report({level}, "\n".join(lines))
             self.report({'OPERATOR'}, f"Asset Catalog updated")
             bpy.ops.screen.info_log_show()
 
@@ -162,11 +462,12 @@ class RenderAssetThumbnails(bpy.types.Operator):
 
     def setup_directory(self) -> None:
         self.thumb_dir = f"{os.path.dirname(bpy.data.filepath)}/thumbnails"
+        self._collection_dirs = {}
 
 
 
     def delete_object(self, name: str) -> None:
-        bpy.ops.object.select_all(action='DESELECT')
+        self.deselect_all(bpy.context)
         bpy.data.objects[name].select_set(True)
         bpy.ops.object.delete()
 
@@ -180,13 +481,22 @@ class RenderAssetThumbnails(bpy.types.Operator):
             'use_nodes': context.scene.use_nodes,
             'file_format': context.scene.render.image_settings.file_format,
             'color_mode': context.scene.render.image_settings.color_mode,
+            'quality': context.scene.render.image_settings.quality,
+            'color_depth': context.scene.render.image_settings.color_depth,
             'cam_pos': context.scene.camera.location.copy(),
             'cam_rot': context.scene.camera.rotation_euler.copy(),
-            'cam_lens':  context.scene.camera.data.lens
+            'cam_lens':  context.scene.camera.data.lens,
+            'engine': context.scene.render.engine,
+            'threads_mode': context.scene.render.threads_mode,
+            'frame_start': context.scene.frame_start,
+            'frame_end': context.scene.frame_end,
+            'frame_current': context.scene.frame_current
         }
+        cycles = getattr(context.scene, 'cycles', None)
+        if hasattr(cycles, 'tile_size'):
+            self._settings['tile_size'] = cycles.tile_size
 
         area = self.get_area_type('VIEW_3D')
-        prefs = bpy.context.preferences.addons[__name__].preferences
         
         # Match the camera's focal length to that of the viewport if applicable
         if area.spaces.active.region_3d.view_perspective == 'PERSP':
@@ -202,12 +512,27 @@ class RenderAssetThumbnails(bpy.types.Operator):
             bpy.ops.view3d.camera_to_view()        
 
         # Setup temp settings
-        context.scene.render.resolution_x = prefs.thumb_res
-        context.scene.render.resolution_y = prefs.thumb_res
+        context.scene.frame_start = 1
+        context.scene.frame_end = 1
+        context.scene.frame_set(1)
+        context.scene.render.resolution_x = self._prefs.thumb_res
+        context.scene.render.resolution_y = self._prefs.thumb_res
         context.scene.render.film_transparent = True
         context.scene.use_nodes = False
-        context.scene.render.image_settings.file_format = 'PNG'
+        context.scene.render.image_settings.file_format = self._prefs.thumb_format
         context.scene.render.image_settings.color_mode = 'RGBA'
+        context.scene.render.image_settings.quality = 90
+        # Thumbnails don't need 16 bit depth
+        context.scene.render.image_settings.color_depth = '8'
+
+        # A single tile covering the whole thumbnail avoids Cycles' per tile scheduling overhead
+        if 'tile_size' in self._settings:
+            cycles.tile_size = self._prefs.thumb_res
+        context.scene.render.threads_mode = 'AUTO'
+
+        # Workbench skips ray-tracing and denoising entirely, which is plenty for small previews
+        if self._prefs.use_workbench_render:
+            context.scene.render.engine = 'BLENDER_WORKBENCH'
 
 
 
@@ -219,9 +544,18 @@ class RenderAssetThumbnails(bpy.types.Operator):
             context.scene.use_nodes = self._settings['use_nodes']
             context.scene.render.image_settings.file_format = self._settings['file_format']
             context.scene.render.image_settings.color_mode = self._settings['color_mode']
+            context.scene.render.image_settings.quality = self._settings['quality']
+            context.scene.render.image_settings.color_depth = self._settings['color_depth']
             context.scene.camera.location = self._settings['cam_pos']
             context.scene.camera.rotation_euler = self._settings['cam_rot']
             context.scene.camera.data.lens = self._settings['cam_lens']
+            context.scene.render.engine = self._settings['engine']
+            context.scene.render.threads_mode = self._settings['threads_mode']
+            context.scene.frame_start = self._settings['frame_start']
+            context.scene.frame_end = self._settings['frame_end']
+            context.scene.frame_set(self._settings['frame_current'])
+            if 'tile_size' in self._settings:
+                context.scene.cycles.tile_size = self._settings['tile_size']
 
 
 
@@ -238,6 +572,7 @@ class RenderAssetThumbnails(bpy.types.Operator):
 
 
     def execute(self, context):
+        self._prefs = context.preferences.addons[__name__].preferences
         status = self.check_preconditions(context)
         if status == 'err':
             return {'CANCELLED'}
@@ -245,16 +580,29 @@ class RenderAssetThumbnails(bpy.types.Operator):
         if bpy.context.active_object and bpy.context.active_object.mode == 'EDIT':
             bpy.ops.object.editmode_toggle()
 
+        # Per asset type handlers, only types in allowed_types reach them
+        self._handlers = {bpy.types.Object: self._enable_obj, bpy.types.Collection: self._enable_coll}
+        self._collection_names = {
+            bpy.types.Object: lambda obj: obj.users_collection[0].name,
+            bpy.types.Collection: lambda collection: collection.name,
+        }
+
         self.setup_directory()
         self.setup_camera(context)
         if not os.path.exists(self.thumb_dir):
             os.mkdir(self.thumb_dir)
 
         self.disable_visible_objects()
+
+        num_procs = self._prefs.num_procs
+        if num_procs > 1 and len(context.selected_assets) > 1:
+            self.launch_workers(context, context.selected_assets, num_procs)
+            return {'RUNNING_MODAL'}
+
         objs = self.render_thumbnail(context, context.selected_assets)
 
         # Only show the report if the user has more than one asset selected
-        if context.preferences.addons[__name__].preferences.show_report and objs and len(context.selected_assets) > 1:
+        if self._prefs.show_report and objs and len(context.selected_assets) > 1:
             self.show_report(objs)
 
         self.enable_visible_objects()
@@ -280,6 +628,36 @@ class RenderAssetThumbnails_Preferences(AddonPreferences):
         description = "Displays a confirmation log when a batch of thumbnails has finished rendering"
     )
 
+    use_workbench_render : BoolProperty(
+        name = "Fast Workbench Render",
+        default = True,
+        description = "Render thumbnails with Workbench instead of the scene's render engine"
+    )
+
+    reuse_camera_framing : BoolProperty(
+        name = "Reuse Camera Framing",
+        default = False,
+        description = "Skip reframing the camera when an asset has about the same bounds as the one it was last framed on"
+    )
+
+    thumb_format : EnumProperty(
+        name = "Format",
+        items = [
+            ('WEBP', "WebP", "Smaller files, faster to write"),
+            ('PNG', "PNG", "Lossless, larger files"),
+        ],
+        default = 'WEBP',
+        description = "Image format of rendered thumbnails"
+    )
+
+    num_procs : IntProperty(
+        name = "Background Workers",
+        default = 1,
+        min = 1,
+        max = os.cpu_count() or 1,
+        description = "Amount of background Blender instances rendering a batch in parallel, 1 renders in the current instance"
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -291,8 +669,20 @@ class RenderAssetThumbnails_Preferences(AddonPreferences):
         xrow.label(text="Resolution")
         xrow.prop(self, "thumb_res", text="", expand=True)
 
+        formatrow = resbox.row()
+        formatrow.alignment = "RIGHT"
+        formatrow.label(text="Format")
+        formatrow.prop(self, "thumb_format", text="")
+
+        procrow = resbox.row()
+        procrow.alignment = "RIGHT"
+        procrow.label(text="Background Workers")
+        procrow.prop(self, "num_procs", text="")
+
         otherbox = contents.column()
         otherbox.prop(self, "show_report")
+        otherbox.prop(self, "use_workbench_render")
+        otherbox.prop(self, "reuse_camera_framing")
 
 
 def draw_operator(self, context):